@@ -1,11 +1,43 @@
 import os
 import time
+import math
+import hashlib
+import uuid
+import sqlite3
+import re
 import logging
+import threading
+from collections import Counter, deque
+from itertools import islice
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 import streamlit as st
-import requests
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import orjson
+import httpx
 from dotenv import load_dotenv
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+
+# Optional: local sentence embeddings for the semantic response cache
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+# Optional: Aho-Corasick automaton for the fallback topic lookup
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: RE2 runs the regex fallback as a linear-time DFA (no backtracking).
+# That fallback only runs when pyahocorasick is missing; both are in requirements.txt.
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -14,6 +46,69 @@ logging.basicConfig(level=logging.INFO)
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 SHIPPO_API_URL = "https://api.goshippo.com/shipments/"
 SHIPPO_TRACK_URL = "https://api.goshippo.com/tracks/{carrier}/{tracking_number}/"
+# Hosts whose connections are opened before the first user request
+WARM_URLS = ["https://api.groq.com/", "https://api.goshippo.com/"]
+
+# Connect and read timeouts in seconds for every outbound HTTP call
+HTTP_TIMEOUT = httpx.Timeout(15.0, connect=3.05)
+# Responses retried with exponential backoff before they reach the caller
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+HTTP_RETRIES = 3
+HTTP_BACKOFF = 0.3
+# Status retries resend the request, so by default only these methods get them
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+# Longest Retry-After we wait out; beyond this the 429 goes back to the caller
+RETRY_AFTER_MAX = 15.0
+# Attempts for the LLM call when a single request times out
+GROQ_MAX_ATTEMPTS = 2
+# Deadline for an LLM call, counted from submission; attempts and status retries stop
+# once it has passed, so the worker gives up about when the caller stops waiting
+GROQ_RESULT_TIMEOUT = HTTP_TIMEOUT.read * GROQ_MAX_ATTEMPTS
+# Worker threads for outbound API calls
+HTTP_MAX_WORKERS = 8
+# Idle pooled connections stay open this long (httpx drops them after 5 s by default),
+# so the warm-up and earlier turns still pay off when the user takes a while to type
+HTTP_KEEPALIVE_EXPIRY = 300.0
+
+# Groq completion settings
+GROQ_MODEL = "mixtral-8x7b-32768"
+GROQ_MAX_TOKENS = 500
+GROQ_TEMPERATURE = 0.7
+SYSTEM_PROMPT = "You are an expert AI assistant specializing in logistics, shipping, trucking, and freight forwarding. Provide accurate, helpful, and concise information to user queries. Always maintain a friendly and professional tone."
+# Built and serialized once; every chat request starts with this message
+_SYSTEM_MSG = ("system", SYSTEM_PROMPT)
+_SYSTEM_MSG_JSON = orjson.dumps({"role": "system", "content": SYSTEM_PROMPT})
+# A 200 whose body isn't the expected JSON (e.g. an HTML page from a gateway) raises one of these
+GROQ_RESPONSE_ERRORS = (ValueError, KeyError, IndexError)
+# Recent messages kept in session state for the chat UI; the full history lives in SQLite
+CHAT_HISTORY_MAXLEN = 20
+
+# Older chat turns are folded into a running summary instead of being resent
+CHAT_SUMMARY_EVERY = 6
+SUMMARY_MODEL = "llama-3.1-8b-instant"
+SUMMARY_MAX_TOKENS = 200
+
+# On-disk cache for Groq responses, keyed by the exact request
+CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+RESPONSE_CACHE_PATH = os.path.join(CACHE_DIR, "groq_responses.db")
+RESPONSE_CACHE_TTL = 24 * 60 * 60
+RESPONSE_CACHE_MAX_ENTRIES = 1000
+
+# Semantic cache for paraphrased questions. Opt-in: it only runs when sentence-transformers
+# (and numpy) are installed, which requirements.txt leaves out because of the torch download
+SEMANTIC_CACHE_PATH = os.path.join(CACHE_DIR, "semantic_cache.db")
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_TTL = 24 * 60 * 60
+SEMANTIC_CACHE_MAX_ENTRIES = 1000
+
+# Short queries that hit a fallback topic get the canned answer without an LLM call
+DIRECT_ANSWER_MAX_WORDS = 8
+
+# Chat turns per browser session. Session ids change on reload, so these rows are never
+# shown again; they only feed the Groq context window and expire after CHAT_HISTORY_TTL.
+CHAT_DB_PATH = os.path.join(CACHE_DIR, "chat_history.db")
+CHAT_HISTORY_TTL = 24 * 60 * 60
 
 # Set page config at the very beginning
 st.set_page_config(page_title="Logistics AI Assistant", page_icon="🚚", layout="wide")
@@ -23,15 +118,89 @@ load_dotenv()
 SHIPPO_API_KEY = os.getenv("SHIPPO_API_KEY")
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 
+# Auth headers only depend on env vars, so build them once
+GROQ_HEADERS = {
+    "Authorization": f"Bearer {GROQ_API_KEY}",
+    "Content-Type": "application/json"
+}
+SHIPPO_HEADERS = {
+    "Authorization": f"ShippoToken {SHIPPO_API_KEY}",
+    "Content-Type": "application/json"
+}
+
+# Shared HTTP/2 client so Groq/Shippo calls multiplex over pooled connections.
+# Cached as a resource so the pool survives reruns and is shared by all sessions.
+# No spinner: pool threads call this too, and a spinner would be drawn into the page from there.
+@st.cache_resource(show_spinner=False)
+def get_http_client() -> httpx.Client:
+    limits = httpx.Limits(max_keepalive_connections=16, max_connections=32, keepalive_expiry=HTTP_KEEPALIVE_EXPIRY)
+    # The transport retries failed connection attempts; status codes are retried in send_request
+    transport = httpx.HTTPTransport(http2=True, limits=limits, retries=HTTP_RETRIES)
+    client = httpx.Client(transport=transport, timeout=HTTP_TIMEOUT)
+    threading.Thread(target=_warm_connections, args=(client,), daemon=True).start()
+    return client
+
+def _warm_connections(client: httpx.Client) -> None:
+    # Do the TCP+TLS handshakes up front so the first real call reuses a pooled connection
+    for url in WARM_URLS:
+        try:
+            client.head(url)
+        except httpx.HTTPError as e:
+            logging.info(f"Connection warm-up to {url} failed: {str(e)}")
+
+# Create the client as the app starts so warm-up runs before the first query
+get_http_client()
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    # A 429 says how long to wait, either in seconds or as an HTTP date
+    retry_after = response.headers.get("Retry-After")
+    if response.status_code == 429 and retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    return HTTP_BACKOFF * 2 ** attempt
+
+def send_request(method: str, url: str, stream: bool = False, retry_status: Optional[bool] = None, deadline: Optional[float] = None, **kwargs) -> httpx.Response:
+    # Pass retry_status=True for POSTs that are safe to resend (e.g. completions, which create nothing).
+    # deadline is a time.monotonic() value; no retry is started that would end after it.
+    if retry_status is None:
+        retry_status = method in IDEMPOTENT_METHODS
+    client = get_http_client()
+    request = client.build_request(method, url, **kwargs)
+    for attempt in range(HTTP_RETRIES + 1):
+        response = client.send(request, stream=stream)
+        if not retry_status or response.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+            return response
+        delay = _retry_delay(response, attempt)
+        if delay > RETRY_AFTER_MAX or (deadline is not None and time.monotonic() + delay >= deadline):
+            return response
+        response.close()
+        time.sleep(delay)
+
 # Initialize chat history in session state
 if "chat_history" not in st.session_state:
-    st.session_state.chat_history = []
+    st.session_state.chat_history = deque(maxlen=CHAT_HISTORY_MAXLEN)
+# Keys this session's rows in the chat history database
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex
+# Running summary of the chat, plus how many trailing messages it doesn't cover yet
+if "chat_summary" not in st.session_state:
+    st.session_state.chat_summary = ""
+    st.session_state.unsummarized_count = 0
+    # Background fold in progress, and how many pending messages it covers
+    st.session_state.summary_future = None
+    st.session_state.summary_covers = 0
 
 def format_timestamp() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-def get_greeting() -> str:
-    current_hour = datetime.now().hour
+@st.cache_data(ttl=60 * 60)
+def _greeting_for_hour(current_hour: int) -> str:
     if current_hour < 12:
         return "Good morning! How can I assist you with your logistics needs today?"
     elif current_hour < 18:
@@ -39,105 +208,525 @@ def get_greeting() -> str:
     else:
         return "Good evening! How may I assist you with your shipping and logistics inquiries?"
 
-def get_enhanced_chatbot_response(user_input: str, chat_history: List[Dict[str, str]]) -> Optional[str]:
+def get_greeting() -> str:
+    return _greeting_for_hour(datetime.now().hour)
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache_db() -> sqlite3.Connection:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(RESPONSE_CACHE_PATH, check_same_thread=False)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS response_cache ("
+        "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS response_cache_created ON response_cache (created_at)")
+    conn.commit()
+    return conn
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache_lock() -> threading.Lock:
+    # Shared by every session; the connection is used from several threads
+    return threading.Lock()
+
+def _response_cache_key(messages: tuple, model: str, temperature: float, max_tokens: int) -> Optional[str]:
+    # Only context-free questions (chat system prompt + user turn) are cached; earlier turns,
+    # a running summary or a summary fold make the key practically unique
+    if messages[:1] != (_SYSTEM_MSG,) or any(role != "user" for role, _ in messages[1:]):
+        return None
+    canonical = orjson.dumps([messages, model, temperature, max_tokens])
+    return hashlib.sha256(canonical).hexdigest()
+
+def _response_cache_get(key: Optional[str]) -> Optional[str]:
+    if key is None:
+        return None
+    with get_response_cache_lock():
+        row = get_response_cache_db().execute(
+            "SELECT response FROM response_cache WHERE key = ? AND created_at >= ?",
+            (key, time.time() - RESPONSE_CACHE_TTL)
+        ).fetchone()
+    return row[0] if row else None
+
+def _response_cache_set(key: Optional[str], content: str) -> None:
+    if key is None:
+        return
+    now = time.time()
+    with get_response_cache_lock():
+        conn = get_response_cache_db()
+        conn.execute("DELETE FROM response_cache WHERE created_at < ?", (now - RESPONSE_CACHE_TTL,))
+        conn.execute(
+            "INSERT OR REPLACE INTO response_cache (key, response, created_at) VALUES (?, ?, ?)",
+            (key, content, now)
+        )
+        # Keep only the newest entries
+        conn.execute(
+            "DELETE FROM response_cache WHERE key NOT IN "
+            "(SELECT key FROM response_cache ORDER BY created_at DESC LIMIT ?)",
+            (RESPONSE_CACHE_MAX_ENTRIES,)
+        )
+        conn.commit()
+
+def _groq_request_body(messages: tuple, model: str, temperature: float, max_tokens: int, stream: bool = False) -> bytes:
+    # Splice JSON fragments so the constant system message is never re-encoded
+    if messages and messages[0] == _SYSTEM_MSG:
+        fragments = [_SYSTEM_MSG_JSON]
+        messages = messages[1:]
+    else:
+        fragments = []
+    fragments.extend(orjson.dumps({"role": role, "content": content}) for role, content in messages)
+
+    options = {"model": model, "max_tokens": max_tokens, "temperature": temperature}
+    if stream:
+        options["stream"] = True
+    return b'{"messages":[' + b",".join(fragments) + b"]," + orjson.dumps(options)[1:]
+
+def _groq_call(messages: tuple, model: str, temperature: float, max_tokens: int, deadline: Optional[float] = None) -> str:
+    key = _response_cache_key(messages, model, temperature, max_tokens)
+    cached = _response_cache_get(key)
+    if cached is not None:
+        return cached
+
+    body = _groq_request_body(messages, model, temperature, max_tokens)
+    response = send_request("POST", GROQ_API_URL, retry_status=True, deadline=deadline, headers=GROQ_HEADERS, content=body)
+    response.raise_for_status()
+    content = orjson.loads(response.content)["choices"][0]["message"]["content"]
+
+    _response_cache_set(key, content)
+    return content
+
+def _groq_stream(messages: tuple, model: str, temperature: float, max_tokens: int) -> Iterator[str]:
+    key = _response_cache_key(messages, model, temperature, max_tokens)
+    cached = _response_cache_get(key)
+    if cached is not None:
+        yield cached
+        return
+
+    body = _groq_request_body(messages, model, temperature, max_tokens, stream=True)
+    response = send_request("POST", GROQ_API_URL, stream=True, retry_status=True, headers=GROQ_HEADERS, content=body)
+    try:
+        response.raise_for_status()
+        parts = []
+        # Server-sent events: one "data: {...}" line per chunk, ending with "data: [DONE]"
+        for line in response.iter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = line[len("data: "):]
+            if data == "[DONE]":
+                break
+            delta = orjson.loads(data)["choices"][0]["delta"].get("content")
+            if delta:
+                parts.append(delta)
+                yield delta
+    finally:
+        response.close()
+
+    # Only complete responses are cached; a closed generator never gets here
+    if parts:
+        _response_cache_set(key, "".join(parts))
+
+@st.cache_resource
+def get_embedding_model():
+    if SentenceTransformer is None:
+        logging.info("sentence-transformers not installed; semantic cache disabled")
+        return None
+    return SentenceTransformer(SEMANTIC_CACHE_MODEL)
+
+@st.cache_resource
+def get_semantic_cache_db() -> sqlite3.Connection:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(SEMANTIC_CACHE_PATH, check_same_thread=False)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS semantic_cache ("
+        "namespace TEXT NOT NULL, embedding BLOB NOT NULL, response TEXT NOT NULL, created_at REAL NOT NULL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS semantic_cache_ns ON semantic_cache (namespace, created_at)")
+    conn.commit()
+    return conn
+
+@st.cache_resource
+def get_semantic_cache_lock() -> threading.Lock:
+    return threading.Lock()
+
+def embed_text(text: str):
+    model = get_embedding_model()
+    if model is None:
+        return None
+    return model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+def semantic_cache_lookup(embedding, namespace: str) -> Optional[str]:
+    with get_semantic_cache_lock():
+        rows = get_semantic_cache_db().execute(
+            "SELECT embedding, response FROM semantic_cache WHERE namespace = ? AND created_at >= ?",
+            (namespace, time.time() - SEMANTIC_CACHE_TTL)
+        ).fetchall()
+    if not rows:
+        return None
+
+    # Embeddings are normalized, so the dot product is the cosine similarity
+    matrix = np.stack([np.frombuffer(blob, dtype=np.float32) for blob, _ in rows])
+    scores = matrix @ embedding
+    best = int(np.argmax(scores))
+    if scores[best] > SEMANTIC_CACHE_THRESHOLD:
+        return rows[best][1]
+    return None
+
+def semantic_cache_store(embedding, namespace: str, response: str) -> None:
+    now = time.time()
+    with get_semantic_cache_lock():
+        conn = get_semantic_cache_db()
+        conn.execute("DELETE FROM semantic_cache WHERE created_at < ?", (now - SEMANTIC_CACHE_TTL,))
+        conn.execute(
+            "INSERT INTO semantic_cache (namespace, embedding, response, created_at) VALUES (?, ?, ?, ?)",
+            (namespace, embedding.tobytes(), response, now)
+        )
+        # Keep only the newest entries; every lookup scores the whole namespace
+        conn.execute(
+            "DELETE FROM semantic_cache WHERE rowid NOT IN "
+            "(SELECT rowid FROM semantic_cache ORDER BY created_at DESC LIMIT ?)",
+            (SEMANTIC_CACHE_MAX_ENTRIES,)
+        )
+        conn.commit()
+
+@st.cache_resource
+def get_chat_db() -> sqlite3.Connection:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(CHAT_DB_PATH, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS chat_messages ("
+        "session_id TEXT NOT NULL, ts REAL NOT NULL, role TEXT NOT NULL, content TEXT NOT NULL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS chat_messages_session ON chat_messages (session_id, ts)")
+    conn.execute("CREATE INDEX IF NOT EXISTS chat_messages_ts ON chat_messages (ts)")
+    conn.commit()
+    return conn
+
+@st.cache_resource
+def get_chat_db_lock() -> threading.Lock:
+    return threading.Lock()
+
+def save_chat_message(session_id: str, role: str, content: str) -> None:
+    now = time.time()
+    with get_chat_db_lock():
+        conn = get_chat_db()
+        conn.execute("DELETE FROM chat_messages WHERE ts < ?", (now - CHAT_HISTORY_TTL,))
+        conn.execute(
+            "INSERT INTO chat_messages (session_id, ts, role, content) VALUES (?, ?, ?, ?)",
+            (session_id, now, role, content)
+        )
+        conn.commit()
+
+def load_recent_chat_messages(session_id: str, limit: int) -> List[Dict[str, str]]:
+    if limit <= 0:
+        return []
+    with get_chat_db_lock():
+        rows = get_chat_db().execute(
+            "SELECT role, content FROM chat_messages WHERE session_id = ? ORDER BY ts DESC, rowid DESC LIMIT ?",
+            (session_id, limit)
+        ).fetchall()
+    return [{"role": role, "content": content} for role, content in reversed(rows)]
+
+def delete_chat_messages(session_id: str) -> None:
+    with get_chat_db_lock():
+        conn = get_chat_db()
+        conn.execute("DELETE FROM chat_messages WHERE session_id = ?", (session_id,))
+        conn.commit()
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=HTTP_MAX_WORKERS, thread_name_prefix="api")
+
+def recent_turns(chat_history: Iterable[Dict[str, str]], count: int) -> List[Dict[str, str]]:
+    # Walks back from the end, so a deque history is never copied in full
+    if count <= 0:
+        return []
+    turns = list(islice(reversed(chat_history), count))
+    turns.reverse()
+    return turns
+
+def build_chat_messages(user_input: str, chat_history: Iterable[Dict[str, str]], summary: str = "") -> tuple:
+    # Hashable (role, content) pairs so identical requests share a cache entry
+    messages = (_SYSTEM_MSG,)
+    if summary:
+        messages += (("system", f"Summary of the earlier conversation: {summary}"),)
+    return messages + tuple((chat["role"], chat["content"]) for chat in recent_turns(chat_history, 5)) + (("user", user_input),)
+
+def _groq_call_with_retries(messages: tuple, model: str = GROQ_MODEL, temperature: float = GROQ_TEMPERATURE, max_tokens: int = GROQ_MAX_TOKENS, deadline: Optional[float] = None) -> Optional[str]:
+    if deadline is None:
+        deadline = time.monotonic() + GROQ_RESULT_TIMEOUT
+    for attempt in range(1, GROQ_MAX_ATTEMPTS + 1):
+        # Also covers time spent queued in the pool
+        if time.monotonic() >= deadline:
+            logging.error(f"API Error: no response within {GROQ_RESULT_TIMEOUT}s")
+            break
+        try:
+            return _groq_call(messages, model, temperature, max_tokens, deadline)
+        except httpx.TransportError as e:
+            logging.warning(f"API attempt {attempt}/{GROQ_MAX_ATTEMPTS} failed: {str(e)}")
+        except (httpx.HTTPError, *GROQ_RESPONSE_ERRORS) as e:
+            logging.error(f"API Error: {str(e)}")
+            break
+    return None
+
+def submit_with_script_ctx(fn, *args) -> Future:
+    # Pool threads need the script context to use the st.cache_resource helpers
+    ctx = get_script_run_ctx()
+
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args)
+
+    return get_executor().submit(run)
+
+def submit_groq_call(messages: tuple) -> Future:
+    # The pool only gives the call a deadline the caller can wait on; the clock starts at submission
+    deadline = time.monotonic() + GROQ_RESULT_TIMEOUT
+    return submit_with_script_ctx(_groq_call_with_retries, messages, GROQ_MODEL, GROQ_TEMPERATURE, GROQ_MAX_TOKENS, deadline)
+
+def _semantic_lookup(user_input: str, namespace: str) -> Tuple[Optional["np.ndarray"], Optional[str]]:
+    embedding = embed_text(user_input)
+    if embedding is None:
+        return None, None
+    return embedding, semantic_cache_lookup(embedding, namespace)
+
+def summarize_conversation(summary: str, chat_history: List[Dict[str, str]]) -> Optional[str]:
+    # Never cached: the fold has its own system prompt, which _response_cache_key skips
+    transcript = "\n".join(f"{chat['role']}: {chat['content']}" for chat in chat_history)
+    messages = (
+        ("system", "Summarize this logistics support conversation in a few sentences. Keep shipment details, locations, carriers, and open questions."),
+        ("user", f"Previous summary: {summary or 'None'}\n\nNew messages:\n{transcript}"),
+    )
+    return _groq_call_with_retries(messages, SUMMARY_MODEL, 0.0, SUMMARY_MAX_TOKENS)
+
+def append_chat_message(role: str, content: str, sent_at: Optional[str] = None) -> None:
+    # The timestamp is only shown in the UI; the stored content is what goes back to Groq
+    save_chat_message(st.session_state.session_id, role, content)
+    chat = {"role": role, "content": content}
+    if sent_at:
+        chat["sent_at"] = sent_at
+    st.session_state.chat_history.append(chat)
+    st.session_state.unsummarized_count += 1
+
+def clear_chat_history() -> None:
+    delete_chat_messages(st.session_state.session_id)
+    st.session_state.chat_history = deque(maxlen=CHAT_HISTORY_MAXLEN)
+    st.session_state.chat_summary = ""
+    st.session_state.unsummarized_count = 0
+    st.session_state.summary_future = None
+
+def pending_chat_turns() -> List[Dict[str, str]]:
+    # Read from the database: the UI deque may already have dropped older pending turns
+    return load_recent_chat_messages(st.session_state.session_id, st.session_state.unsummarized_count)
+
+def schedule_chat_summary() -> None:
+    # Fold the unsummarized turns in the pool once enough have piled up, off the reply's critical path
+    if st.session_state.summary_future is not None:
+        return
+    pending = pending_chat_turns()
+    if not GROQ_API_KEY or len(pending) < CHAT_SUMMARY_EVERY:
+        return
+    st.session_state.summary_future = submit_with_script_ctx(summarize_conversation, st.session_state.chat_summary, pending)
+    st.session_state.summary_covers = len(pending)
+
+def apply_chat_summary() -> None:
+    # Picks up a finished fold without waiting; until then (or on failure) the turns are sent as-is
+    future = st.session_state.summary_future
+    if future is None or not future.done():
+        return
+    st.session_state.summary_future = None
+    summary = future.result()
+    if summary:
+        st.session_state.chat_summary = summary
+        # Turns appended while the fold was running are still pending
+        st.session_state.unsummarized_count -= st.session_state.summary_covers
+
+def get_enhanced_chatbot_response(user_input: str, chat_history: Iterable[Dict[str, str]], summary: str = "", force_llm: bool = False) -> Optional[str]:
+    # Buffered path for the tool pages; the semantic cache is only used by the chat stream
     if not GROQ_API_KEY:
         return get_fallback_response(user_input)
 
-    headers = {
-        "Authorization": f"Bearer {GROQ_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    
-    messages = [
-        {
-            "role": "system",
-            "content": "You are an expert AI assistant specializing in logistics, shipping, trucking, and freight forwarding. Provide accurate, helpful, and concise information to user queries. Always maintain a friendly and professional tone."
-        },
-    ] + [{"role": chat["role"], "content": chat["content"]} for chat in chat_history[-5:]] + [{"role": "user", "content": user_input}]
-    
-    payload = {
-        "model": "mixtral-8x7b-32768",
-        "messages": messages,
-        "max_tokens": 500,
-        "temperature": 0.7
-    }
-    
+    direct = None if force_llm else get_direct_response(user_input)
+    if direct is not None:
+        return direct
+
+    groq_future = submit_groq_call(build_chat_messages(user_input, chat_history, summary))
     try:
-        response = requests.post(GROQ_API_URL, headers=headers, json=payload)
-        response.raise_for_status()
-        return response.json()["choices"][0]["message"]["content"]
-    except requests.exceptions.RequestException as e:
-        logging.error(f"API Error: {str(e)}")
-        return get_fallback_response(user_input)
+        response = groq_future.result(timeout=GROQ_RESULT_TIMEOUT)
+    except FutureTimeoutError:
+        logging.error(f"API Error: no response within {GROQ_RESULT_TIMEOUT}s")
+        response = None
+    return response if response is not None else get_fallback_response(user_input)
 
-def get_fallback_response(user_input: str) -> str:
-    logistics_topics = {
-        "shipping rates": "Shipping rates vary depending on factors such as package weight, dimensions, destination, and service level. For accurate rates, please use our Shipping Rates Calculator tool in the Tools section.",
-        "track shipment": "To track a shipment, you'll need the tracking number and carrier information. Please use our Shipment Tracker tool in the Tools section for real-time tracking updates.",
-        "trucking": "Trucking is a crucial part of logistics, involving the transportation of goods by road. It includes various types of services such as full truckload (FTL), less than truckload (LTL), and specialized freight.",
-        "freight forwarding": "Freight forwarding involves organizing shipments from the manufacturer or producer to the final point of distribution or consumer.",
-        "customs": "Customs procedures are essential for international shipping. They involve declaring goods, paying duties and taxes, and complying with import/export regulations.",
-        "packaging": "Proper packaging is crucial for protecting your items during shipping. Use appropriate materials like bubble wrap, packing peanuts, or air pillows.",
-        "insurance": "Shipping insurance provides protection against loss, damage, or theft of your packages.",
-        "international shipping": "International shipping involves additional considerations such as customs documentation, duties and taxes, restricted items, and longer transit times.",
-        "warehousing": "Warehousing is the storage of goods before they are shipped to customers.",
-        "last-mile delivery": "Last-mile delivery refers to the final step of the delivery process from a distribution center to the end customer.",
-    }
+def stream_chatbot_response(user_input: str, chat_history: Iterable[Dict[str, str]], summary: str = "", namespace: str = "global", use_semantic_cache: bool = True, force_llm: bool = False) -> Iterator[str]:
+    if not GROQ_API_KEY:
+        yield get_fallback_response(user_input)
+        return
+
+    direct = None if force_llm else get_direct_response(user_input)
+    if direct is not None:
+        yield direct
+        return
+
+    messages = build_chat_messages(user_input, chat_history, summary)
+    # Like the exact cache, only context-free questions (system prompt + question) are
+    # looked up or stored; a follow-up's answer depends on the turns before it
+    if len(messages) > 2:
+        use_semantic_cache = False
+    # Only open the stream (and pay for the tokens) when the semantic cache misses
+    embedding, cached = _semantic_lookup(user_input, namespace) if use_semantic_cache else (None, None)
+    if cached is not None:
+        yield cached
+        return
+
+    for attempt in range(1, GROQ_MAX_ATTEMPTS + 1):
+        chunks = _groq_stream(messages, GROQ_MODEL, GROQ_TEMPERATURE, GROQ_MAX_TOKENS)
+        try:
+            first = next(chunks, "")
+        except httpx.TransportError as e:
+            logging.warning(f"API attempt {attempt}/{GROQ_MAX_ATTEMPTS} failed: {str(e)}")
+            continue
+        except (httpx.HTTPError, *GROQ_RESPONSE_ERRORS) as e:
+            logging.error(f"API Error: {str(e)}")
+            break
+
+        parts = [first]
+        yield first
+        try:
+            for chunk in chunks:
+                parts.append(chunk)
+                yield chunk
+        except (httpx.HTTPError, *GROQ_RESPONSE_ERRORS) as e:
+            # Part of the answer is already on screen, so don't retry or fall back
+            logging.error(f"API Error mid-stream: {str(e)}")
+            return
+
+        if embedding is not None and first:
+            semantic_cache_store(embedding, namespace, "".join(parts))
+        return
+
+    yield get_fallback_response(user_input)
+
+LOGISTICS_TOPICS = {
+    "shipping rates": "Shipping rates vary depending on factors such as package weight, dimensions, destination, and service level. For accurate rates, please use our Shipping Rates Calculator tool in the Tools section.",
+    "track shipment": "To track a shipment, you'll need the tracking number and carrier information. Please use our Shipment Tracker tool in the Tools section for real-time tracking updates.",
+    "trucking": "Trucking is a crucial part of logistics, involving the transportation of goods by road. It includes various types of services such as full truckload (FTL), less than truckload (LTL), and specialized freight.",
+    "freight forwarding": "Freight forwarding involves organizing shipments from the manufacturer or producer to the final point of distribution or consumer.",
+    "customs": "Customs procedures are essential for international shipping. They involve declaring goods, paying duties and taxes, and complying with import/export regulations.",
+    "packaging": "Proper packaging is crucial for protecting your items during shipping. Use appropriate materials like bubble wrap, packing peanuts, or air pillows.",
+    "insurance": "Shipping insurance provides protection against loss, damage, or theft of your packages.",
+    "international shipping": "International shipping involves additional considerations such as customs documentation, duties and taxes, restricted items, and longer transit times.",
+    "warehousing": "Warehousing is the storage of goods before they are shipped to customers.",
+    "last-mile delivery": "Last-mile delivery refers to the final step of the delivery process from a distribution center to the end customer.",
+}
+_TOPIC_KEYS = tuple(LOGISTICS_TOPICS)
+
+@st.cache_resource(ttl=24 * 60 * 60)
+def get_topic_matcher():
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for priority, topic in enumerate(LOGISTICS_TOPICS):
+            automaton.add_word(topic, (priority, topic))
+        automaton.make_automaton()
+        return automaton
+    # Fallback for installs without pyahocorasick: a single alternation still scans
+    # the input once, and the named group that matched identifies the topic
+    engine = re2 or re
+    return engine.compile("|".join(f"(?P<t{i}>{engine.escape(topic)})" for i, topic in enumerate(LOGISTICS_TOPICS)))
+
+def match_logistics_topic(user_input: str) -> Optional[str]:
+    matcher = get_topic_matcher()
+    low = user_input.lower()
+    if ahocorasick is None:
+        match = matcher.search(low)
+        return _TOPIC_KEYS[int(match.lastgroup[1:])] if match else None
+
+    # Earliest match in the input wins, ties go to the topic listed first
+    best = None
+    for end, (priority, topic) in matcher.iter(low):
+        candidate = (end - len(topic) + 1, priority, topic)
+        if best is None or candidate < best:
+            best = candidate
+    return best[2] if best else None
+
+@st.cache_resource
+def get_bypass_stats() -> Counter:
+    return Counter()
+
+def get_direct_response(user_input: str) -> Optional[str]:
+    # Trivial topic lookups skip the LLM; questions and longer queries still go to Groq
+    topic = None
+    if "?" not in user_input and len(user_input.split()) < DIRECT_ANSWER_MAX_WORDS:
+        topic = match_logistics_topic(user_input)
+
+    stats = get_bypass_stats()
+    stats["total"] += 1
+    if topic is not None:
+        stats["bypassed"] += 1
+        logging.info(f"Answered '{topic}' without the LLM (bypass rate {stats['bypassed']}/{stats['total']})")
+        return LOGISTICS_TOPICS[topic]
+    return None
 
-    for topic, response in logistics_topics.items():
-        if topic in user_input.lower():
-            return response
+def get_fallback_response(user_input: str) -> str:
+    topic = match_logistics_topic(user_input)
+    if topic is not None:
+        return LOGISTICS_TOPICS[topic]
 
     return "I'm here to help with all your logistics needs, including shipping, trucking, and freight forwarding. Could you please provide more specific information about what you'd like to know? Feel free to ask about topics such as shipping rates, tracking, customs, packaging, insurance, or any other logistics-related questions."
 
-def get_shipping_rates(origin, destination, weight, length, width, height):
-
-    url = "https://api.goshippo.com/shipments/"
-    headers = {"Authorization": f"ShippoToken {SHIPPO_API_KEY}"}
+def build_parcel(weight, length, width, height) -> Dict[str, str]:
+    return {
+        "length": str(length),
+        "width": str(width),
+        "height": str(height),
+        "distance_unit": "in",
+        "weight": str(weight),
+        "mass_unit": "lb"
+    }
 
-    payload = {
+def build_shipment(origin, destination, parcels: List[Dict[str, str]]) -> Dict:
+    return {
         "address_from": origin,
         "address_to": destination,
-        "parcels": [
-            {
-                "length": str(length),
-                "width": str(width),
-                "height": str(height),
-                "distance_unit": "in",
-                "weight": str(weight),
-                "mass_unit": "lb"
-            }
-        ],
+        "parcels": parcels,
         "async": False
     }
 
+def format_shipping_rates(data: Dict) -> str:
+    if "rates" in data and data["rates"]:
+        rates_info = []
+        for rate in data["rates"][:5]:  # Display top 5 rates
+            rates_info.append(f"{rate['provider']} - ${rate['amount']} ({rate['duration_terms']})")
+        return "Available shipping rates:\n" + "\n".join(rates_info)
+    else:
+        return "No rates found for the given shipment details. Please check your input and try again."
+
+def get_shipping_rates(origin, destination, parcels: List[Dict[str, str]]) -> str:
+    # Shippo rates every parcel of a multi-piece shipment in a single request
+    payload = build_shipment(origin, destination, parcels)
+
     try:
-        response = requests.post(url, headers=headers, json=payload)
+        response = send_request("POST", SHIPPO_API_URL, headers=SHIPPO_HEADERS, content=orjson.dumps(payload))
         response.raise_for_status()
-        data = response.json()
-        
-        if "rates" in data and data["rates"]:
-            rates_info = []
-            for rate in data["rates"][:5]:  # Display top 5 rates
-                rates_info.append(f"{rate['provider']} - ${rate['amount']} ({rate['duration_terms']})")
-            return "Available shipping rates:\n" + "\n".join(rates_info)
-        else:
-            return "No rates found for the given shipment details. Please check your input and try again."
-    except requests.exceptions.RequestException as e:
-        print(f"Shippo API Error: {str(e)}")
+        return format_shipping_rates(orjson.loads(response.content))
+    except (httpx.HTTPError, ValueError) as e:
+        logging.error(f"Shippo API Error: {str(e)}")
         return "An error occurred while fetching shipping rates. Please try again later or contact support."
 
+def get_shipping_rates_per_parcel(origin, destination, parcels: List[Dict[str, str]]) -> List[str]:
+    # Quotes run in the API pool on the shared HTTP/2 client, so they multiplex over its warm connection
+    futures = [submit_with_script_ctx(get_shipping_rates, origin, destination, [parcel]) for parcel in parcels]
+    return [future.result() for future in futures]
+
 def track_shipment(tracking_number, carrier):
     if not SHIPPO_API_KEY:
         return "Shipment tracking is currently unavailable. Please try again later or contact support."
 
-    url = f"https://api.goshippo.com/tracks/{carrier}/{tracking_number}/"
-    headers = {"Authorization": f"ShippoToken {SHIPPO_API_KEY}"}
+    url = SHIPPO_TRACK_URL.format(carrier=carrier, tracking_number=tracking_number)
 
     try:
-        response = requests.get(url, headers=headers)
+        response = send_request("GET", url, headers=SHIPPO_HEADERS)
         response.raise_for_status()
-        tracking_info = response.json()
+        tracking_info = orjson.loads(response.content)
         
         status = tracking_info['tracking_status']['status']
         location = tracking_info['tracking_status']['location']['city']
@@ -145,15 +734,133 @@ def track_shipment(tracking_number, carrier):
         eta = tracking_info['eta'] if 'eta' in tracking_info else 'Not available'
         
         return f"Tracking Status: {status}\nCurrent Location: {location}, {country}\nEstimated Delivery: {eta}"
-    except requests.exceptions.RequestException as e:
-        print(f"Shippo API Error: {str(e)}")
+    except (httpx.HTTPError, ValueError) as e:
+        logging.error(f"Shippo API Error: {str(e)}")
         return "An error occurred while tracking the shipment. Please try again later or contact support."
 
 def get_chatbot_response(user_input):
-    response_timestamp = format_timestamp()
-    response = get_enhanced_chatbot_response(user_input, st.session_state.chat_history)
+    apply_chat_summary()
+    return st.write_stream(stream_chatbot_response(
+        user_input,
+        pending_chat_turns(),
+        summary=st.session_state.chat_summary,
+        force_llm=st.session_state.force_llm
+    ))
+
+# Page sections run as fragments, so interacting with one reruns only that section
+@st.fragment
+def chat_ui():
+    # Native chat elements; markdown is rendered by the frontend instead of per-message HTML
+    for chat in st.session_state.chat_history:
+        with st.chat_message(chat["role"]):
+            st.markdown(chat["content"])
+            if "sent_at" in chat:
+                st.caption(f"Sent at {chat['sent_at']}")
+
+    user_input = st.chat_input("Ask me anything about shipping, logistics, or freight:", key="user_input")
+
+    if user_input:
+        with st.chat_message("user"):
+            st.markdown(user_input)
+        with st.chat_message("assistant"):
+            response_timestamp = format_timestamp()
+            bot_response = get_chatbot_response(user_input)
+            st.caption(f"Sent at {response_timestamp}")
+        # Both turns are already on screen, so no rerun is needed
+        append_chat_message("user", user_input)
+        append_chat_message("assistant", bot_response, sent_at=response_timestamp)
+        schedule_chat_summary()
+
+    # Runs as a callback, before the fragment reruns, so no extra rerun is needed
+    st.button("Clear Chat History", key="clear_chat", on_click=clear_chat_history)
+
+@st.fragment
+def shipping_rates_tool():
+    st.subheader("Calculate Shipping Rates")
+    col1, col2 = st.columns(2)
     
-    return f"🤖 {response} (sent at {response_timestamp})"
+    with col1:
+        st.markdown("### Origin")
+        origin = {
+            "name": st.text_input("Sender Name", key="sender_name"),
+            "street1": st.text_input("Street Address", key="sender_street"),
+            "city": st.text_input("City", key="sender_city"),
+            "state": st.text_input("State", key="sender_state"),
+            "zip": st.text_input("ZIP Code", key="sender_zip"),
+            "country": "US"
+        }
+
+    with col2:
+        st.markdown("### Destination")
+        destination = {
+            "name": st.text_input("Recipient Name", key="recipient_name"),
+            "street1": st.text_input("Street Address", key="recipient_street"),
+            "city": st.text_input("City", key="recipient_city"),
+            "state": st.text_input("State", key="recipient_state"),
+            "zip": st.text_input("ZIP Code", key="recipient_zip"),
+            "country": "US"
+        }
+
+    st.markdown("### Package Details")
+    packages = st.data_editor(
+        [{"weight": 1.0, "length": 10.0, "width": 10.0, "height": 10.0}],
+        num_rows="dynamic",
+        use_container_width=True,
+        column_config={
+            "weight": st.column_config.NumberColumn("Weight (lbs)", min_value=0.1, required=True, step=0.1, default=1.0),
+            "length": st.column_config.NumberColumn("Length (in)", min_value=1.0, required=True, step=0.1, default=10.0),
+            "width": st.column_config.NumberColumn("Width (in)", min_value=1.0, required=True, step=0.1, default=10.0),
+            "height": st.column_config.NumberColumn("Height (in)", min_value=1.0, required=True, step=0.1, default=10.0),
+        },
+        key="packages"
+    )
+    separate_quotes = st.checkbox("Quote each package as a separate shipment", key="separate_quotes")
+
+    if st.button("Calculate Shipping Rates"):
+        # Cleared cells come back as None or NaN; skip those rows
+        parcels = [
+            build_parcel(**package) for package in packages
+            if all(value is not None and not math.isnan(value) for value in package.values())
+        ]
+        if not parcels:
+            st.warning("Please enter at least one package.")
+        elif separate_quotes:
+            with st.spinner("Calculating rates..."):
+                for number, rates in enumerate(get_shipping_rates_per_parcel(origin, destination, parcels), start=1):
+                    st.success(f"Package {number}\n{rates}")
+        else:
+            with st.spinner("Calculating rates..."):
+                rates = get_shipping_rates(origin, destination, parcels)
+                st.success(rates)
+
+@st.fragment
+def shipment_tracker_tool():
+    st.subheader("Track Your Shipment")
+    tracking_number = st.text_input("Enter Tracking Number:")
+    carrier = st.selectbox("Select Carrier:", ["usps", "fedex", "ups"])
+
+    if st.button("Track Shipment"):
+        with st.spinner("Tracking shipment..."):
+            tracking_info = track_shipment(tracking_number, carrier)
+            st.info(tracking_info)
+
+@st.fragment
+def trucking_info_tool():
+    st.subheader("Trucking Information")
+    trucking_query = st.text_input("What would you like to know about trucking?")
+    if st.button("Get Trucking Info"):
+        with st.spinner("Fetching information..."):
+            info = get_enhanced_chatbot_response(f"Provide information about {trucking_query} in the context of trucking and transportation.", [])
+            st.write(info)
+
+@st.fragment
+def freight_forwarding_tool():
+    st.subheader("Freight Forwarding Guide")
+    freight_query = st.text_input("What aspect of freight forwarding would you like to learn about?")
+    if st.button("Get Freight Forwarding Info"):
+        with st.spinner("Fetching information..."):
+            info = get_enhanced_chatbot_response(f"Provide information about {freight_query} in the context of freight forwarding.", [])
+            st.write(info)
 
 # Main application
 st.title("🚚 Logistics AI Assistant")
@@ -161,31 +868,15 @@ st.markdown("<h3>Your Intelligent Shipping and Logistics Partner</h3>", unsafe_a
 
 st.sidebar.header("Navigation")
 page = st.sidebar.radio("Go to", ["Home", "Tools", "Contact"])
+# Power users can send every query to the AI model, even ones with a canned answer
+st.sidebar.checkbox("Always ask the AI model", key="force_llm")
 
 if page == "Home":
     st.header("Welcome to Your Logistics Command Center")
     st.markdown(f"<h4>{get_greeting()}</h4>", unsafe_allow_html=True)
 
     st.subheader("Chat with Our AI Logistics Expert")
-    
-    for chat in st.session_state.chat_history:
-        if chat["role"] == "user":
-            st.markdown(f'<div style="background-color:#E6F3FF; border-radius:10px; padding:10px; margin:5px;"><strong>You:</strong> {chat["content"]}</div>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<div style="background-color:#F0F0F0; border-radius:10px; padding:10px; margin:5px;"><strong>AI:</strong> {chat["content"]}</div>', unsafe_allow_html=True)
-    
-    user_input = st.text_input("Ask me anything about shipping, logistics, or freight:", key="user_input")
-
-    if st.button("Send", key="send_button"):
-        if user_input:
-            st.session_state.chat_history.append({"role": "user", "content": user_input})
-            bot_response = get_chatbot_response(user_input)
-            st.session_state.chat_history.append({"role": "assistant", "content": bot_response})
-            st.rerun()
-
-    if st.button("Clear Chat History", key="clear_chat"):
-        st.session_state.chat_history = []
-        st.rerun()
+    chat_ui()
 
 elif page == "Tools":
     st.header("Logistics Tools")
@@ -193,72 +884,13 @@ elif page == "Tools":
     tool_choice = st.selectbox("Select a tool:", ["Shipping Rates Calculator", "Shipment Tracker", "Trucking Information", "Freight Forwarding Guide"])
     
     if tool_choice == "Shipping Rates Calculator":
-        st.subheader("Calculate Shipping Rates")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("### Origin")
-            origin = {
-                "name": st.text_input("Sender Name", key="sender_name"),
-                "street1": st.text_input("Street Address", key="sender_street"),
-                "city": st.text_input("City", key="sender_city"),
-                "state": st.text_input("State", key="sender_state"),
-                "zip": st.text_input("ZIP Code", key="sender_zip"),
-                "country": "US"
-            }
-
-        with col2:
-            st.markdown("### Destination")
-            destination = {
-                "name": st.text_input("Recipient Name", key="recipient_name"),
-                "street1": st.text_input("Street Address", key="recipient_street"),
-                "city": st.text_input("City", key="recipient_city"),
-                "state": st.text_input("State", key="recipient_state"),
-                "zip": st.text_input("ZIP Code", key="recipient_zip"),
-                "country": "US"
-            }
-
-        st.markdown("### Package Details")
-        col3, col4, col5, col6 = st.columns(4)
-        with col3:
-            weight = st.number_input("Weight (lbs)", min_value=0.1, value=1.0, step=0.1)
-        with col4:
-            length = st.number_input("Length (in)", min_value=1.0, value=10.0, step=0.1)
-        with col5:
-            width = st.number_input("Width (in)", min_value=1.0, value=10.0, step=0.1)
-        with col6:
-            height = st.number_input("Height (in)", min_value=1.0, value=10.0, step=0.1)
-
-        if st.button("Calculate Shipping Rates"):
-            with st.spinner("Calculating rates..."):
-                rates = get_shipping_rates(origin, destination, weight, length, width, height)
-                st.success(rates)
-
+        shipping_rates_tool()
     elif tool_choice == "Shipment Tracker":
-        st.subheader("Track Your Shipment")
-        tracking_number = st.text_input("Enter Tracking Number:")
-        carrier = st.selectbox("Select Carrier:", ["usps", "fedex", "ups"])
-
-        if st.button("Track Shipment"):
-            with st.spinner("Tracking shipment..."):
-                tracking_info = track_shipment(tracking_number, carrier)
-                st.info(tracking_info)
-
+        shipment_tracker_tool()
     elif tool_choice == "Trucking Information":
-        st.subheader("Trucking Information")
-        trucking_query = st.text_input("What would you like to know about trucking?")
-        if st.button("Get Trucking Info"):
-            with st.spinner("Fetching information..."):
-                info = get_enhanced_chatbot_response(f"Provide information about {trucking_query} in the context of trucking and transportation.", [])
-                st.write(info)
-
+        trucking_info_tool()
     elif tool_choice == "Freight Forwarding Guide":
-        st.subheader("Freight Forwarding Guide")
-        freight_query = st.text_input("What aspect of freight forwarding would you like to learn about?")
-        if st.button("Get Freight Forwarding Info"):
-            with st.spinner("Fetching information..."):
-                info = get_enhanced_chatbot_response(f"Provide information about {freight_query} in the context of freight forwarding.", [])
-                st.write(info)
+        freight_forwarding_tool()
 
 elif page == "Contact":
     st.header("Contact Us")